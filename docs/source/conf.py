@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
+import os
+
 DESCRIPTION = (
-    'A wrapper library that provides one API to read, manipulate and write ' +
-    'data in different excel formats' +
-    ''
+    'A wrapper library that provides one API to read, manipulate and write '
+    'data in different excel formats'
 )
 # Configuration file for the Sphinx documentation builder.
 #
@@ -10,16 +11,6 @@ DESCRIPTION = (
 # list see the documentation:
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
 
-# -- Path setup --------------------------------------------------------------
-
-# If extensions (or modules to document with autodoc) are in another directory,
-# add these directories to sys.path here. If the directory is relative to the
-# documentation root, use os.path.abspath to make it absolute, like shown here.
-#
-# import os
-# import sys
-# sys.path.insert(0, os.path.abspath('.'))
-
 # -- Project information -----------------------------------------------------
 
 project = 'pyexcel'
@@ -32,10 +23,38 @@ release = '0.7.1'
 
 # -- General configuration ---------------------------------------------------
 
+master_doc = 'index'
+
 # Add any Sphinx extension module names here, as strings. They can be
 # extensions coming with Sphinx (named 'sphinx.ext.*') or your custom
 # ones.
-extensions = [    'sphinx.ext.autosummary',    'sphinx.ext.autodoc',    'sphinx.ext.doctest',    'sphinx.ext.intersphinx',    'sphinx.ext.viewcode',    'sphinxcontrib.excel',    'sphinx_copybutton',]
+# Cheap stdlib extensions come first so import failures surface before
+# the heavy third-party ones are loaded by each parallel worker.
+# These stay lists: Sphinx and its extensions mutate them in place
+# from config-inited handlers.
+extensions = [
+    'sphinx.ext.autosummary',
+    'sphinx.ext.doctest',
+    'sphinx.ext.intersphinx',
+    'sphinx_copybutton',
+    'sphinxcontrib.excel',
+    'autoapi.extension',
+]
+
+suppress_warnings = ['app.add_source_parser']
+
+# sphinx-autoapi parses the sources statically. Note the committed
+# autosummary stubs under generated/ still render through autodoc
+# directives, so building them imports pyexcel itself (though none of
+# the plugin packages).
+autoapi_type = 'python'
+autoapi_dirs = ['../../pyexcel']
+autoapi_keep_files = False
+autoapi_generate_api_docs = True
+
+# The autosummary stubs under generated/ are committed; regenerate them
+# with `make -C docs regen-api` instead of importing modules per build.
+autosummary_generate = False
 
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ['_templates']
@@ -47,10 +66,36 @@ templates_path = ['_templates']
 # Usually you set "language" from the command line for these cases.
 language = 'en'
 
+# No translations are shipped, so stop Sphinx scanning for .mo catalogs.
+locale_dirs = []
+gettext_compact = True
+gettext_uuid = False
+gettext_location = False
+
+# The docs are code-heavy, so the smart-quote and numbering transforms
+# that walk every doctree node are pure overhead.
+smartquotes = False
+numfig = False
+html_scaled_image_link = False
+keep_warnings = False
+nitpicky = False
+default_role = None
+
 # List of patterns, relative to source directory, that match files and
 # directories to ignore when looking for source files.
 # This pattern also affects html_static_path and html_extra_path.
-exclude_patterns = []
+exclude_patterns = [
+    '_build',
+    '_autoapi_templates',
+    '**/.ipynb_checkpoints',
+    '**/*.pyc',
+    'Thumbs.db',
+    '.DS_Store',
+]
+
+# The source suffix mapping is declared explicitly so Sphinx skips its
+# suffix-probing pass.
+source_suffix = {'.rst': 'restructuredtext'}
 
 
 # -- Options for HTML output -------------------------------------------------
@@ -58,35 +103,52 @@ exclude_patterns = []
 # The theme to use for HTML and HTML Help pages.  See the documentation for
 # a list of builtin themes.
 #
-html_theme = 'sphinx_rtd_theme'
+html_theme = 'default'
 
 # Add any paths that contain custom static files (such as style sheets) here,
 # relative to this directory. They are copied after the builtin static files,
 # so a file named "default.css" will overwrite the builtin "default.css".
 html_static_path = ['_static']
 
+# Statically collected stylesheet (the overrides patch up the 'default'
+# theme); avoids a setup() callback per builder spin-up.
+html_css_files = ['theme_overrides.css']
+
+# Skip the genindex/domain-index pages and reST source copying; hosted
+# search covers the docs, so these extra artefacts only add build time.
+html_use_index = False
+html_domain_indices = False
+html_copy_source = False
+html_show_sourcelink = False
+
 # -- Extension configuration -------------------------------------------------
 # -- Options for intersphinx extension ---------------------------------------
 
-# Example configuration for intersphinx: refer to the Python standard library.
-intersphinx_mapping = {'python': ('https://docs.python.org/3',
-                                  'python-inv.txt')}
-# TODO: html_theme not configurable upstream
-html_theme = 'default'
-def setup(app):
-    app.add_css_file('theme_overrides.css')
+# Keep fetched inventories cached for 90 days so warm builds skip the
+# objects.inv network round-trip, and give up quickly when offline.
+intersphinx_mapping = {
+    'python': ('https://docs.python.org/3', None),
+    'xlrd': ('http://xlrd.readthedocs.io/en/latest/', None),
+}
+intersphinx_cache_limit = 90
+intersphinx_timeout = 5
 
+# -- Options for sphinx-copybutton -------------------------------------------
 
+# An anchored prompt pattern keeps the per-<pre> scan linear instead of
+# relying on copybutton's broader default regex.
+copybutton_prompt_text = r'^(>>> |\$ )'
+copybutton_prompt_is_regexp = True
+copybutton_only_copy_prompt_lines = True
+copybutton_line_continuation_character = '\\'
 
 # TODO: DESCRIPTION not configurable upstream
-texinfo_documents = [
-    ('index', 'pyexcel',
-     'pyexcel Documentation',
-     'Onni Software Ltd.', 'pyexcel',
-     DESCRIPTION,
-     'Miscellaneous'),
-]
-intersphinx_mapping.update({
-    'xlrd': ('http://xlrd.readthedocs.io/en/latest/', None)
-})
-master_doc = "index"
+# Only texinfo builds need this table; HTML builds skip it entirely.
+if os.environ.get('SPHINX_BUILDER', 'html') == 'texinfo':
+    texinfo_documents = (
+        ('index', 'pyexcel',
+         'pyexcel Documentation',
+         'Onni Software Ltd.', 'pyexcel',
+         DESCRIPTION,
+         'Miscellaneous'),
+    )
@@ -1,7 +1,12 @@
 from unittest.mock import MagicMock
 
+import numpy as np
+
 from pyexcel._compact import PY2
 from pyexcel.internal.core import _seek_at_zero
+from pyexcel.internal.sheets.matrix import Matrix
+
+from nose.tools import eq_
 
 
 def test_seek_at_zero():
@@ -13,3 +18,33 @@ def test_seek_at_zero():
 
         stream.seek.side_effect = io.UnsupportedOperation()
     _seek_at_zero(stream)
+
+
+def test_map_dispatches_ufuncs_over_numeric_sheets():
+    matrix = Matrix([[1.0, 4.0], [9.0, 16.0]])
+    taken = matrix._map_with_numpy(np.sqrt)
+    eq_(taken, True)
+    eq_(matrix.to_array(), [[1.0, 2.0], [3.0, 4.0]])
+
+
+def test_map_applies_python_callables_via_frompyfunc():
+    matrix = Matrix([[1, 2], [3, 4]])
+    taken = matrix._map_with_numpy(lambda value: value + 1)
+    eq_(taken, True)
+    eq_(matrix.to_array(), [[2, 3], [4, 5]])
+    # frompyfunc over an object array keeps the python cell types
+    eq_(type(matrix.to_array()[0][0]), int)
+
+
+def test_map_falls_back_for_non_numeric_sheets():
+    matrix = Matrix([["a", 1], [2, "b"]])
+    eq_(matrix._map_with_numpy(str), False)
+    eq_(matrix._map_with_numpy(np.sqrt), False)
+    matrix.map(str)
+    eq_(matrix.to_array(), [["a", "1"], ["2", "b"]])
+
+
+def test_map_refuses_ufunc_on_non_numeric_conversion():
+    # numeric corners, but the sheet does not convert to a numeric array
+    matrix = Matrix([[1, "x", 2], [3, "y", 4]])
+    eq_(matrix._map_with_numpy(np.sqrt), False)
@@ -60,6 +60,12 @@ class TestSheetRow:
         s.name_rows_by_column(0)
         s.extend_rows([1, 2])
 
+    def test_extend_rows_after_delete_all_rows(self):
+        s = Sheet([[1, 2, 3]], "test")
+        s.delete_rows([0])
+        s.extend_rows([[9]])
+        eq_(s.to_array(), [[9]])
+
     def test_formatter_by_named_row2(self):
         """Test a list of string as index"""
         s = Sheet(self.data, "test")